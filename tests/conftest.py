@@ -0,0 +1,62 @@
+import os
+import random
+import sys
+
+import pytest
+from bson.objectid import ObjectId
+
+# Keep the suite offline: the module must never reach for Mongo
+os.environ['STORAGE_BACKEND'] = 'memory'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as scheduler  # noqa: E402
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    repository = scheduler.Repository('memory')
+    monkeypatch.setattr(scheduler, 'storage', repository)
+    return repository
+
+
+@pytest.fixture
+def client(storage):
+    scheduler.limiter.enabled = False
+    scheduler.app.config['TESTING'] = True
+    return scheduler.app.test_client()
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    """Small, fast GA settings; tests may update the returned dict"""
+    values = {
+        'ga_population_size': 30,
+        'ga_generations': 30,
+        'ga_mutation_rate': 0.05,
+        'ga_crossover_rate': 0.7,
+        'local_search_time_limit': 1.0,
+        'local_search_max_iterations': 500,
+        'decomposition_max_workers': 1,
+    }
+    monkeypatch.setattr(scheduler, 'get_settings', lambda: values)
+    return values
+
+
+@pytest.fixture
+def make_problem():
+    def build(n_courses=20, n_rooms=4, n_teachers=8, n_departments=3, seed=0):
+        rng = random.Random(seed)
+        departments = [{'_id': ObjectId(), 'name': f'Department {i}'} for i in range(n_departments)]
+        teachers = [{'_id': ObjectId(), 'name': f'Lecturer {i}'} for i in range(n_teachers)]
+        rooms = [{'_id': ObjectId(), 'name': f'Room {i}', 'capacity': rng.choice([40, 80, 150])} for i in range(n_rooms)]
+        courses = [{
+            '_id': ObjectId(),
+            'name': f'Course {i}',
+            'level': rng.choice(['100', '200', '300']),
+            'department_ids': [rng.choice(departments)['_id']],
+            'lecturer_ids': [rng.choice(teachers)['_id']],
+            'number_of_students': rng.choice([30, 60]),
+            'number_of_lectures_per_week': rng.choice([1, 2]),
+        } for i in range(n_courses)]
+        return courses, rooms, teachers, departments
+    return build
@@ -0,0 +1,116 @@
+from bson.objectid import ObjectId
+
+import app as scheduler
+
+
+def faculty(make_problem, seed):
+    courses, rooms, teachers, _ = make_problem(n_courses=12, n_rooms=3, n_teachers=4, n_departments=2, seed=seed)
+    return courses, rooms, teachers
+
+
+def resources(courses):
+    held = set()
+    for course in courses:
+        held.update(('lecturer', lid) for lid in course['lecturer_ids'])
+        held.update(('group', course['level'], dept_id) for dept_id in course['department_ids'])
+    return held
+
+
+def test_components_follow_shared_lecturers_and_groups():
+    lecturer, department = ObjectId(), ObjectId()
+    a = {'_id': ObjectId(), 'lecturer_ids': [lecturer], 'department_ids': [], 'level': '100'}
+    b = {'_id': ObjectId(), 'lecturer_ids': [], 'department_ids': [department], 'level': '100'}
+    c = {'_id': ObjectId(), 'lecturer_ids': [lecturer], 'department_ids': [department], 'level': '100'}
+    d = {'_id': ObjectId(), 'lecturer_ids': [], 'department_ids': [department], 'level': '200'}
+
+    components = scheduler.find_independent_components([a, b, c, d])
+    assert sorted(len(component) for component in components) == [1, 3]
+
+
+def test_clusters_have_disjoint_rooms_lecturers_and_groups(make_problem):
+    problems = [faculty(make_problem, seed) for seed in range(3)]
+    courses = [c for p in problems for c in p[0]]
+    rooms = [r for p in problems for r in p[1]]
+
+    subproblems = scheduler.decompose_problem(courses, rooms)
+    assert len(subproblems) > 1
+    assert sorted(c['name'] for sub, _ in subproblems for c in sub) == sorted(c['name'] for c in courses)
+    room_ids = [r['_id'] for _, sub_rooms in subproblems for r in sub_rooms]
+    assert len(room_ids) == len(set(room_ids)) == len(rooms)
+    for i, (first, _) in enumerate(subproblems):
+        for second, _ in subproblems[i + 1:]:
+            assert not resources(first) & resources(second)
+
+
+def test_partitioned_rooms_fit_every_course(make_problem):
+    problems = [faculty(make_problem, seed) for seed in range(3)]
+    courses = [c for p in problems for c in p[0]]
+    rooms = [r for p in problems for r in p[1]]
+
+    for sub_courses, sub_rooms in scheduler.decompose_problem(courses, rooms):
+        largest = max(r['capacity'] for r in sub_rooms)
+        assert all(c['number_of_students'] <= largest for c in sub_courses)
+
+
+def test_partition_fails_without_enough_large_rooms():
+    clusters = [
+        [{'_id': ObjectId(), 'number_of_students': 100, 'number_of_lectures_per_week': 1}],
+        [{'_id': ObjectId(), 'number_of_students': 100, 'number_of_lectures_per_week': 1}],
+    ]
+    rooms = [{'_id': ObjectId(), 'capacity': 100}, {'_id': ObjectId(), 'capacity': 20}]
+    assert scheduler.partition_rooms(clusters, rooms) is None
+
+
+def test_solve_timetable_merges_conflict_free_clusters(make_problem, settings):
+    problems = [faculty(make_problem, seed) for seed in range(2)]
+    courses = [c for p in problems for c in p[0]]
+    rooms = [r for p in problems for r in p[1]]
+    teachers = [t for p in problems for t in p[2]]
+
+    schedule = scheduler.solve_timetable(courses, rooms, teachers, seed=1)
+    assert schedule is not None
+    assert len(schedule) == sum(c['number_of_lectures_per_week'] for c in courses)
+    assert scheduler.schedule_penalty(schedule, courses, rooms) == 0
+
+
+def test_near_miss_clusters_fall_back_to_whole_problem(make_problem, settings, monkeypatch):
+    problems = [faculty(make_problem, seed) for seed in range(3)]
+    courses = [c for p in problems for c in p[0]]
+    rooms = [r for p in problems for r in p[1]]
+    calls = []
+
+    def cluster_with_clashes(cluster_courses, cluster_rooms, teachers, seed=None):
+        calls.append(len(cluster_courses))
+        if len(cluster_courses) == len(courses):
+            return 'whole problem'
+        # Accepted per cluster, but the clashes add up past the threshold once merged
+        return [{'course_id': c['_id'], 'room_id': cluster_rooms[0]['_id'], 'day': 'Monday', 'time_slot': scheduler.time_slots[0]}
+                for c in cluster_courses]
+
+    monkeypatch.setattr(scheduler, 'genetic_algorithm', cluster_with_clashes)
+    assert scheduler.solve_timetable(courses, rooms, [], seed=1) == 'whole problem'
+    assert calls[-1] == len(courses)
+
+
+def test_solver_pool_follows_configured_size(monkeypatch):
+    created = []
+
+    class FakePool:
+        def __init__(self, max_workers, mp_context):
+            self.max_workers = max_workers
+            self.shut_down = False
+            created.append(self)
+
+        def shutdown(self, wait=True):
+            self.shut_down = True
+
+    monkeypatch.setattr(scheduler, 'ProcessPoolExecutor', FakePool)
+    monkeypatch.setattr(scheduler, 'solver_pool', None)
+    monkeypatch.setattr(scheduler, 'solver_pool_size', None)
+
+    first = scheduler.get_solver_pool(2)
+    assert scheduler.get_solver_pool(2) is first
+    resized = scheduler.get_solver_pool(4)
+    assert resized.max_workers == 4
+    assert first.shut_down and not resized.shut_down
+    assert len(created) == 2
@@ -0,0 +1,86 @@
+import pytest
+from bson.objectid import ObjectId
+
+import app as scheduler
+
+WEEKLY_SLOTS = len(scheduler.DAYS) * len(scheduler.time_slots)
+
+
+def course(name, lectures, students=30, lecturer=None, department=None, level='100'):
+    return {
+        '_id': ObjectId(),
+        'name': name,
+        'level': level,
+        'lecturer_ids': [lecturer] if lecturer else [],
+        'department_ids': [department] if department else [],
+        'number_of_students': students,
+        'number_of_lectures_per_week': lectures,
+    }
+
+
+def room(capacity):
+    return {'_id': ObjectId(), 'name': f'Room {capacity}', 'capacity': capacity}
+
+
+def test_feasible_data_has_no_diagnostics(make_problem):
+    courses, rooms, teachers, departments = make_problem()
+    assert scheduler.analyze_feasibility(courses, rooms, teachers, departments) == []
+
+
+def test_lecturer_overload_names_lecturer_and_courses():
+    lecturer = {'_id': ObjectId(), 'name': 'Ada'}
+    courses = [course('Algebra', WEEKLY_SLOTS, lecturer=lecturer['_id']), course('Geometry', 1, lecturer=lecturer['_id'])]
+
+    [diagnostic] = scheduler.analyze_feasibility(courses, [room(50), room(50)], [lecturer])
+    assert diagnostic['type'] == 'lecturer_overload'
+    assert diagnostic['lecturers'] == ['Ada']
+    assert diagnostic['courses'] == ['Algebra', 'Geometry']
+    assert (diagnostic['required'], diagnostic['available']) == (WEEKLY_SLOTS + 1, WEEKLY_SLOTS)
+
+
+def test_group_overload_uses_department_name():
+    department = {'_id': ObjectId(), 'name': 'Physics'}
+    courses = [course(f'Course {i}', 13, department=department['_id']) for i in range(2)]
+    courses.append(course('Other level', 13, department=department['_id'], level='200'))
+
+    [diagnostic] = scheduler.analyze_feasibility(courses, [room(50)] * 3, [], [department])
+    assert diagnostic['type'] == 'group_overload'
+    assert 'Physics' in diagnostic['message']
+    assert diagnostic['courses'] == ['Course 0', 'Course 1']
+
+
+def test_course_larger_than_every_room():
+    diagnostics = scheduler.analyze_feasibility([course('Huge', 1, students=500)], [room(100)], [])
+    assert [d['type'] for d in diagnostics] == ['room_too_small']
+    assert diagnostics[0]['courses'] == ['Huge']
+
+
+def test_oversized_courses_are_not_counted_in_capacity_classes():
+    courses = [course('Huge', 1, students=500), course('Regular', WEEKLY_SLOTS, students=100)]
+
+    diagnostics = scheduler.analyze_feasibility(courses, [room(100)], [])
+    assert [d['type'] for d in diagnostics] == ['room_too_small']
+    assert diagnostics[0]['courses'] == ['Huge']
+
+
+def test_capacity_class_shortage():
+    lecturer = {'_id': ObjectId(), 'name': 'Grace'}
+    courses = [course('Big', WEEKLY_SLOTS, students=120), course('Also big', 1, students=120, lecturer=lecturer['_id']), course('Small', 5, students=20)]
+
+    diagnostics = scheduler.analyze_feasibility(courses, [room(150), room(40), room(40)], [lecturer])
+    assert [d['type'] for d in diagnostics] == ['room_capacity_shortage']
+    assert diagnostics[0]['courses'] == ['Also big', 'Big']
+    assert diagnostics[0]['lecturers'] == ['Grace']
+    assert (diagnostics[0]['required'], diagnostics[0]['available']) == (WEEKLY_SLOTS + 1, WEEKLY_SLOTS)
+
+
+def test_generate_route_reports_diagnostics_without_solving(client, storage, monkeypatch):
+    lecturer_id = storage.teachers.insert_one({'name': 'Ada'}).inserted_id
+    storage.rooms.insert_one(room(10))
+    storage.courses.insert_one(course('Huge', 1, students=500, lecturer=lecturer_id))
+    monkeypatch.setattr(scheduler, 'solve_timetable', lambda *args, **kwargs: pytest.fail('solver should not run'))
+
+    response = client.get('/generate_timetable')
+    assert response.status_code == 200
+    assert b'Courses: Huge' in response.data
+    assert b'Lecturers: Ada' in response.data
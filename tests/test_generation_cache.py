@@ -0,0 +1,102 @@
+import pytest
+
+import app as scheduler
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / 'generation_cache.json'
+    monkeypatch.setattr(scheduler, 'GENERATION_CACHE_FILE', str(path))
+    monkeypatch.setattr(scheduler, 'generation_cache', None)
+    return path
+
+
+def test_generation_key_ignores_document_order(make_problem, settings):
+    courses, rooms, teachers, _ = make_problem()
+    key = scheduler.compute_generation_key(courses, rooms, teachers, settings, seed=1)
+    assert key == scheduler.compute_generation_key(courses[::-1], rooms[::-1], teachers, settings, seed=1)
+
+
+def test_generation_key_changes_with_data_and_seed(make_problem, settings):
+    courses, rooms, teachers, _ = make_problem()
+    key = scheduler.compute_generation_key(courses, rooms, teachers, settings, seed=1)
+    assert key != scheduler.compute_generation_key(courses, rooms, teachers, settings, seed=2)
+    courses[0]['number_of_students'] += 1
+    assert key != scheduler.compute_generation_key(courses, rooms, teachers, settings, seed=1)
+
+
+def test_cached_generation_round_trips_through_disk(make_problem, settings, cache_file):
+    courses, rooms, teachers, _ = make_problem()
+    schedule = scheduler.genetic_algorithm(courses, rooms, teachers, seed=3)
+    scheduler.set_cached_generation('key', schedule)
+
+    scheduler.generation_cache = None
+    assert cache_file.exists()
+    assert scheduler.get_cached_generation('key') == schedule
+
+
+def test_cache_evicts_least_recently_used(cache_file, monkeypatch):
+    monkeypatch.setattr(scheduler, 'GENERATION_CACHE_MAX_ENTRIES', 2)
+    scheduler.set_cached_generation('a', [])
+    scheduler.set_cached_generation('b', [])
+    scheduler.get_cached_generation('a')
+    scheduler.set_cached_generation('c', [])
+
+    assert scheduler.get_cached_generation('b') is None
+    assert scheduler.get_cached_generation('a') == []
+    assert scheduler.get_cached_generation('c') == []
+
+
+def test_seeded_runs_are_reproducible(make_problem, settings):
+    courses, rooms, teachers, _ = make_problem()
+    first = scheduler.genetic_algorithm(courses, rooms, teachers, seed=7)
+    assert first == scheduler.genetic_algorithm(courses, rooms, teachers, seed=7)
+
+
+@pytest.fixture
+def small_problem(storage):
+    room_id = storage.rooms.insert_one({'name': 'Hall', 'capacity': 50}).inserted_id
+    course_ids = [storage.courses.insert_one({
+        'name': name, 'level': '100', 'lecturer_ids': [], 'department_ids': [],
+        'number_of_students': 30, 'number_of_lectures_per_week': 1,
+    }).inserted_id for name in ('Algebra', 'Biology')]
+    return course_ids, room_id
+
+
+def counting_solver(monkeypatch, schedule):
+    calls = []
+
+    def solve(*args, **kwargs):
+        calls.append(kwargs.get('seed'))
+        return list(schedule)
+
+    monkeypatch.setattr(scheduler, 'solve_timetable', solve)
+    return calls
+
+
+def test_generate_route_reuses_cached_timetable(client, settings, cache_file, small_problem, monkeypatch):
+    course_ids, room_id = small_problem
+    day, slots = scheduler.DAYS[0], scheduler.time_slots
+    calls = counting_solver(monkeypatch, [
+        {'course_id': course_ids[0], 'room_id': room_id, 'day': day, 'time_slot': slots[0]},
+        {'course_id': course_ids[1], 'room_id': room_id, 'day': day, 'time_slot': slots[1]},
+    ])
+
+    assert client.get('/generate_timetable?seed=5').status_code == 200
+    assert client.get('/generate_timetable?seed=5').status_code == 200
+    assert calls == [5]
+
+    assert client.get('/generate_timetable?seed=6').status_code == 200
+    assert calls == [5, 6]
+
+
+def test_generate_route_does_not_cache_near_misses(client, settings, cache_file, small_problem, monkeypatch):
+    course_ids, room_id = small_problem
+    day, slot = scheduler.DAYS[0], scheduler.time_slots[0]
+    calls = counting_solver(monkeypatch, [
+        {'course_id': course_id, 'room_id': room_id, 'day': day, 'time_slot': slot} for course_id in course_ids
+    ])
+
+    client.get('/generate_timetable?seed=5')
+    client.get('/generate_timetable?seed=5')
+    assert calls == [5, 5]
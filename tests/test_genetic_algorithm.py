@@ -0,0 +1,53 @@
+import copy
+
+from bson.objectid import ObjectId
+
+import app as scheduler
+
+
+def event(course, room, day='Monday', slot=0):
+    return {'course_id': course['_id'], 'room_id': room['_id'], 'day': day, 'time_slot': scheduler.time_slots[slot]}
+
+
+def index(documents):
+    return {str(d['_id']): d for d in documents}
+
+
+def test_evaluate_schedule_scores_each_kind_of_conflict():
+    lecturer, department = ObjectId(), ObjectId()
+    small = {'_id': ObjectId(), 'capacity': 10}
+    big = {'_id': ObjectId(), 'capacity': 100}
+    first = {'_id': ObjectId(), 'level': '100', 'department_ids': [department], 'lecturer_ids': [lecturer], 'number_of_students': 50}
+    second = {'_id': ObjectId(), 'level': '100', 'department_ids': [department], 'lecturer_ids': [lecturer], 'number_of_students': 5}
+    schedule = [event(first, small), event(second, small)]
+
+    penalty, conflicting = scheduler.evaluate_schedule(schedule, index([first, second]), index([small, big]))
+    expected = (scheduler.ROOM_CONFLICT_PENALTY + scheduler.LECTURER_CONFLICT_PENALTY
+                + scheduler.GROUP_CONFLICT_PENALTY + scheduler.CAPACITY_CONFLICT_PENALTY)
+    assert penalty == expected
+    assert conflicting == {0, 1}
+
+    apart = [event(first, big), event(second, small, day='Tuesday')]
+    assert scheduler.evaluate_schedule(apart, index([first, second]), index([small, big])) == (0, set())
+
+
+def test_finds_conflict_free_schedule_without_local_search(make_problem, settings):
+    settings.update({'ga_generations': 200, 'local_search_time_limit': 0})
+    courses, rooms, teachers, _ = make_problem(n_courses=12)
+
+    schedule = scheduler.genetic_algorithm(courses, rooms, teachers, seed=1)
+    assert schedule is not None
+    assert scheduler.schedule_penalty(schedule, courses, rooms) == 0
+    assert len(schedule) == sum(c['number_of_lectures_per_week'] for c in courses)
+
+
+def test_does_not_modify_its_inputs(make_problem, settings):
+    courses, rooms, teachers, _ = make_problem()
+    originals = copy.deepcopy((courses, rooms, teachers))
+    scheduler.genetic_algorithm(courses, rooms, teachers, seed=2)
+    assert (courses, rooms, teachers) == originals
+
+
+def test_no_lectures_gives_empty_schedule(settings):
+    course = {'_id': ObjectId(), 'number_of_lectures_per_week': 0}
+    assert scheduler.genetic_algorithm([course], [{'_id': ObjectId(), 'capacity': 10}], []) == []
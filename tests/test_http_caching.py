@@ -0,0 +1,93 @@
+import json
+
+import app as scheduler
+
+
+def post_json(client, url, data):
+    return client.post(url, data=json.dumps(data), content_type='application/json')
+
+
+def save_timetable(client, storage):
+    post_json(client, '/save_timetable', {'timetable_data': {'Monday': {}}, 'department_name': 'General'})
+    return str(storage.saved_timetables.find_one({})['_id'])
+
+
+def test_departments_revalidate_against_revision(client):
+    post_json(client, '/add_data/departments', {'name': 'Physics'})
+    response = client.get('/get_departments')
+    etag = response.headers['ETag']
+
+    assert response.cache_control.no_cache
+    assert client.get('/get_departments', headers={'If-None-Match': etag}).status_code == 304
+
+    department_id = response.get_json()[0]['_id']
+    post_json(client, f'/update_data/departments/{department_id}', {'name': 'Astrophysics'})
+    updated = client.get('/get_departments', headers={'If-None-Match': etag})
+    assert updated.status_code == 200
+    assert updated.get_json()[0]['name'] == 'Astrophysics'
+
+
+def test_edits_within_one_second_are_not_served_stale(client):
+    post_json(client, '/add_data/departments', {'name': 'Physics'})
+    response = client.get('/get_departments')
+    post_json(client, '/add_data/departments', {'name': 'Chemistry'})
+
+    assert 'Last-Modified' not in response.headers
+    stale = client.get('/get_departments', headers={'If-Modified-Since': 'Fri, 31 Dec 2100 00:00:00 GMT'})
+    assert stale.status_code == 200
+    assert len(stale.get_json()) == 2
+    assert client.get('/get_departments', headers={'If-None-Match': response.headers['ETag']}).status_code == 200
+
+
+def test_weakened_etag_still_matches(client):
+    post_json(client, '/add_data/departments', {'name': 'Physics'})
+    etag = client.get('/get_departments').headers['ETag']
+
+    assert client.get('/get_departments', headers={'If-None-Match': f'W/{etag}'}).status_code == 304
+    assert client.get('/get_departments', headers={'If-None-Match': f'"other", W/{etag}'}).status_code == 304
+
+
+def test_lecturer_pages_have_distinct_etags(client):
+    post_json(client, '/add_data/lecturers', {'name': 'Ada'})
+    first = client.get('/get_lecturers?page=1')
+    second = client.get('/get_lecturers?page=2')
+
+    assert first.headers['ETag'] != second.headers['ETag']
+    assert client.get('/get_lecturers?page=1', headers={'If-None-Match': first.headers['ETag']}).status_code == 304
+
+
+def test_saved_timetable_page_revalidates(client, storage):
+    timetable_id = save_timetable(client, storage)
+    response = client.get(f'/timetable/{timetable_id}')
+
+    assert response.cache_control.no_cache
+    assert client.get(f'/timetable/{timetable_id}', headers={'If-None-Match': response.headers['ETag']}).status_code == 304
+
+
+def test_saved_timetable_pdf_is_long_lived_and_skips_work(client, storage, monkeypatch):
+    timetable_id = save_timetable(client, storage)
+    response = client.get(f'/download_timetable/{timetable_id}')
+    assert response.mimetype == 'application/pdf'
+    assert response.cache_control.max_age == scheduler.SAVED_TIMETABLE_PDF_MAX_AGE
+    assert not response.cache_control.no_cache
+
+    monkeypatch.setattr(scheduler, 'generate_pdf_from_timetable', lambda *args, **kwargs: None)
+    cached = client.get(f'/download_timetable/{timetable_id}', headers={'If-None-Match': response.headers['ETag']})
+    assert cached.status_code == 304
+
+
+def test_deleted_timetable_is_not_served_from_etag(client, storage):
+    timetable_id = save_timetable(client, storage)
+    page = client.get(f'/timetable/{timetable_id}')
+    pdf = client.get(f'/download_timetable/{timetable_id}')
+    client.post(f'/delete_saved_timetable/{timetable_id}')
+
+    assert client.get(f'/timetable/{timetable_id}', headers={'If-None-Match': page.headers['ETag']}).status_code == 404
+    assert client.get(f'/download_timetable/{timetable_id}', headers={'If-None-Match': pdf.headers['ETag']}).status_code == 404
+
+
+def test_unknown_timetable_is_not_modified_for_wildcard(client):
+    missing = client.get(f'/timetable/{"0" * 24}', headers={'If-None-Match': '*'})
+    assert missing.status_code == 404
+    assert 'ETag' not in missing.headers
+    assert client.get('/timetable/not-an-id').status_code == 404
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+from bson.objectid import ObjectId
+
+import app as scheduler
+
+
+def random_schedule(courses, rooms, seed):
+    rng = random.Random(seed)
+    return [{
+        'course_id': course['_id'],
+        'room_id': rng.choice(rooms)['_id'],
+        'day': rng.choice(scheduler.DAYS),
+        'time_slot': rng.choice(scheduler.time_slots),
+    } for course in courses for _ in range(course['number_of_lectures_per_week'])]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_incremental_cost_matches_full_evaluation(make_problem, seed):
+    courses, rooms, _, _ = make_problem(n_courses=40, n_rooms=3, seed=seed)
+    schedule = random_schedule(courses, rooms, seed)
+
+    # With no budget the search only builds its counters, so the cost is the starting penalty
+    _, initial_cost = scheduler.local_search(schedule, courses, rooms, max_iterations=0)
+    assert initial_cost == scheduler.schedule_penalty(schedule, courses, rooms)
+
+    improved, cost = scheduler.local_search(schedule, courses, rooms, rng=random.Random(seed), max_iterations=200)
+    assert cost == scheduler.schedule_penalty(improved, courses, rooms)
+    assert cost <= initial_cost
+
+
+def test_repairs_a_feasible_instance(make_problem):
+    courses, rooms, _, _ = make_problem(n_courses=30, n_rooms=4)
+    schedule = random_schedule(courses, rooms, 0)
+
+    improved, cost = scheduler.local_search(schedule, courses, rooms, time_limit=5.0, rng=random.Random(0))
+    assert cost == 0
+    assert [e['course_id'] for e in improved] == [e['course_id'] for e in schedule]
+
+
+def test_iteration_bound_is_reproducible(make_problem):
+    courses, rooms, _, _ = make_problem(n_courses=40, n_rooms=2)
+    schedule = random_schedule(courses, rooms, 1)
+
+    runs = [scheduler.local_search(schedule, courses, rooms, rng=random.Random(1), max_iterations=30) for _ in range(3)]
+    assert runs[0] == runs[1] == runs[2]
+
+
+def test_does_not_modify_the_input_schedule(make_problem):
+    courses, rooms, _, _ = make_problem()
+    schedule = random_schedule(courses, rooms, 2)
+    snapshot = [dict(event) for event in schedule]
+    scheduler.local_search(schedule, courses, rooms, rng=random.Random(2), max_iterations=50)
+    assert schedule == snapshot
+
+
+def test_genetic_algorithm_with_no_generations_returns_none(make_problem, settings):
+    settings['ga_generations'] = 0
+    courses, rooms, teachers, _ = make_problem()
+    assert scheduler.genetic_algorithm(courses, rooms, teachers, seed=1) is None
+
+
+def test_requires_a_bound(make_problem):
+    courses, rooms, _, _ = make_problem()
+    with pytest.raises(ValueError):
+        scheduler.local_search(random_schedule(courses, rooms, 0), courses, rooms)
+
+
+def test_stops_on_infeasible_data():
+    lecturer = ObjectId()
+    room = {'_id': ObjectId(), 'capacity': 100}
+    course = {'_id': ObjectId(), 'level': '100', 'department_ids': [], 'lecturer_ids': [lecturer],
+              'number_of_students': 10, 'number_of_lectures_per_week': len(scheduler.DAYS) * len(scheduler.time_slots) + 1}
+    schedule = random_schedule([course], [room], 0)
+
+    _, cost = scheduler.local_search(schedule, [course], [room], rng=random.Random(0), max_iterations=20)
+    assert cost >= scheduler.LECTURER_CONFLICT_PENALTY
@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import pytest
+from bson.objectid import ObjectId
+
+import app as scheduler
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def repository(request, tmp_path, monkeypatch):
+    monkeypatch.setattr(scheduler, 'SQLITE_PATH', str(tmp_path / 'scheduler.db'))
+    return scheduler.Repository(request.param)
+
+
+def test_insert_and_find_by_id(repository):
+    created_at = datetime(2024, 1, 1, 9, 30)
+    result = repository.saved_timetables.insert_one({'name': 'Week 1', 'created_at': created_at})
+
+    document = repository.saved_timetables.find_one({'_id': result.inserted_id})
+    assert isinstance(result.inserted_id, ObjectId)
+    assert document == {'_id': result.inserted_id, 'name': 'Week 1', 'created_at': created_at}
+    assert repository.saved_timetables.find_one({'_id': ObjectId()}) is None
+
+
+def test_filters_sort_skip_and_limit(repository):
+    for name in ['Carol', 'Alice', 'Bob']:
+        repository.teachers.insert_one({'name': name})
+    alice = repository.teachers.find_one({'name': 'Alice'})
+
+    assert [t['name'] for t in repository.teachers.find().sort('name', 1)] == ['Alice', 'Bob', 'Carol']
+    assert [t['name'] for t in repository.teachers.find().sort('name', -1).skip(1).limit(1)] == ['Bob']
+    assert [t['name'] for t in repository.teachers.find({'_id': {'$in': [alice['_id']]}})] == ['Alice']
+    assert repository.teachers.count_documents({}) == 3
+
+
+def test_update_and_delete(repository):
+    room_id = repository.rooms.insert_one({'name': 'Hall', 'capacity': 100}).inserted_id
+
+    assert repository.rooms.update_one({'_id': room_id}, {'$set': {'capacity': 120}}).matched_count == 1
+    assert repository.rooms.find_one({'_id': room_id})['capacity'] == 120
+    assert repository.rooms.update_one({'_id': ObjectId()}, {'$set': {'capacity': 1}}).matched_count == 0
+
+    assert repository.rooms.delete_one({'_id': room_id}).deleted_count == 1
+    assert repository.rooms.delete_one({'_id': room_id}).deleted_count == 0
+
+
+def test_upsert_with_increment(repository):
+    for _ in range(3):
+        repository.revisions.update_one({'_id': 'rooms'}, {'$inc': {'revision': 1}}, upsert=True)
+    assert repository.revisions.find_one({'_id': 'rooms'})['revision'] == 3
+
+
+def test_stored_documents_are_isolated_from_callers(repository):
+    document = {'name': 'CS'}
+    repository.departments.insert_one(document)
+    document['name'] = 'Changed'
+
+    loaded = repository.departments.find_one({})
+    loaded['name'] = 'Changed again'
+    assert repository.departments.find_one({})['name'] == 'CS'
+
+
+def test_snapshot_reads_several_collections(repository):
+    repository.courses.insert_one({'name': 'Algorithms'})
+    repository.rooms.insert_one({'name': 'Lab'})
+
+    snapshot = repository.snapshot(['courses', 'rooms', 'teachers'])
+    assert [c['name'] for c in snapshot['courses']] == ['Algorithms']
+    assert [r['name'] for r in snapshot['rooms']] == ['Lab']
+    assert snapshot['teachers'] == []
+
+
+def test_create_indexes_is_idempotent(repository):
+    repository.teachers.insert_one({'name': 'Ada'})
+    scheduler.create_indexes({name: repository.collection(name) for name in scheduler.COLLECTION_NAMES})
+    assert repository.teachers.find_one({'name': 'Ada'})['name'] == 'Ada'
+
+
+def test_mongo_backend_requires_uri(monkeypatch):
+    monkeypatch.setattr(scheduler, 'MONGO_URI', '')
+    with pytest.raises(RuntimeError, match='MONGO_URI'):
+        scheduler.Repository('mongo').teachers
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        scheduler.Repository('redis')